@@ -35,6 +35,10 @@ class ClaudeQueueProcessor:
         self.running = False
         self.poll_interval = 5  # seconds
 
+        # Resolve the Claude binary path once; existence is still checked per
+        # task since unlock_tool can install it while we're running
+        self.claude_path = os.path.expanduser("~/.local/bin/claude")
+
         # Load already processed tasks
         self._load_processed_tasks()
 
@@ -90,7 +94,7 @@ class ClaudeQueueProcessor:
             self._update_task_status(task_id, 'in_progress')
 
             # Find Claude binary
-            claude_path = os.path.expanduser("~/.local/bin/claude")
+            claude_path = self.claude_path
 
             if not os.path.exists(claude_path):
                 log("❌ Claude Code not installed! Run unlock_tool first.")
@@ -109,7 +113,7 @@ class ClaudeQueueProcessor:
 
             # Set PATH to include ~/.local/bin
             env = os.environ.copy()
-            env["PATH"] = f"{os.path.expanduser('~/.local/bin')}:{env.get('PATH', '')}"
+            env["PATH"] = f"{os.path.dirname(claude_path)}:{env.get('PATH', '')}"
 
             # Run in background with stdin closed
             process = subprocess.Popen(
@@ -87,8 +87,7 @@ class ToolRefactorizer:
                             actions_dict_source = ast.get_source_segment(content, node)
                             # Parse the keys
                             if isinstance(node.value, ast.Dict):
-                                actions_dict = [k.s if isinstance(k, ast.Str) else k.value
-                                              for k in node.value.keys if k]
+                                actions_dict = [k.value for k in node.value.keys if k]
                         except:
                             pass
 
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Test memory tracking in system_settings
+
+Points system_settings at a temp directory and checks batch_memory_files
+and build_working_memory against real files on disk.
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "tools"))
+
+import system_settings
+
+
+def setup_sandbox():
+    """Temp BASE_DIR with a data/ folder and two memory files"""
+    sandbox = tempfile.mkdtemp()
+    os.makedirs(os.path.join(sandbox, "data"))
+
+    for name, content in [("a.json", {"a": 1}), ("b.json", {"b": 2})]:
+        with open(os.path.join(sandbox, "data", name), "w") as f:
+            json.dump(content, f)
+
+    system_settings.BASE_DIR = sandbox
+    return sandbox
+
+
+def tracked():
+    return system_settings.list_memory_files({})["memory_files"]
+
+
+def test_batch_memory_files():
+    """Adds and removes land in one write, skipping duplicates and reporting untracked paths"""
+    print("Testing batch_memory_files...")
+
+    sandbox = setup_sandbox()
+
+    try:
+        result = system_settings.batch_memory_files({"add": ["data/a.json", "data/b.json", "data/a.json"]})
+        if result.get("added") != ["data/a.json", "data/b.json"] or tracked() != ["data/a.json", "data/b.json"]:
+            print(f"❌ Unexpected add result: {result}, tracked {tracked()}")
+            return False
+        print("✅ Paths added once, in order")
+
+        result = system_settings.batch_memory_files({"add": ["data/c.json"], "remove": ["data/a.json", "data/missing.json"]})
+        if result.get("removed") != ["data/a.json"] or result.get("not_tracked") != ["data/missing.json"]:
+            print(f"❌ Unexpected remove result: {result}")
+            return False
+        if tracked() != ["data/b.json", "data/c.json"]:
+            print(f"❌ Unexpected tracked files: {tracked()}")
+            return False
+        print("✅ Removals applied and untracked paths reported")
+
+        with open(os.path.join(sandbox, "data", "memory_files.json")) as f:
+            if json.load(f) != ["data/b.json", "data/c.json"]:
+                print("❌ memory_files.json not written")
+                return False
+        print("✅ memory_files.json matches")
+
+        if system_settings.batch_memory_files({}).get("status") != "error":
+            print("❌ Empty batch not rejected")
+            return False
+        print("✅ Empty batch rejected")
+
+        for bad in [{"add": "data/x.json"}, {"add": None, "remove": ["data/b.json"]}, {"remove": ["data/b.json", 1]}]:
+            result = system_settings.batch_memory_files(bad)
+            if result.get("status") != "error":
+                print(f"❌ {bad!r} was not rejected: {result}")
+                return False
+        if tracked() != ["data/b.json", "data/c.json"]:
+            print(f"❌ Rejected batch changed tracked files: {tracked()}")
+            return False
+        print("✅ Non-list add/remove rejected without writing")
+    finally:
+        shutil.rmtree(sandbox)
+
+    return True
+
+
+def test_build_working_memory():
+    """Tracked files load in tracked order; unreadable ones are skipped"""
+    print("\nTesting build_working_memory...")
+
+    sandbox = setup_sandbox()
+
+    try:
+        system_settings.batch_memory_files({"add": ["data/b.json", "data/missing.json", "data/a.json"]})
+
+        result = system_settings.build_working_memory({})
+        if result.get("status") != "success" or result.get("files_loaded") != 2:
+            print(f"❌ Unexpected result: {result}")
+            return False
+        print("✅ Readable files loaded, missing file skipped")
+
+        with open(os.path.join(sandbox, "data", "working_memory.json")) as f:
+            working_memory = json.load(f)
+
+        if list(working_memory.items()) != [("data/b.json", {"b": 2}), ("data/a.json", {"a": 1})]:
+            print(f"❌ Unexpected working memory: {working_memory}")
+            return False
+        print("✅ working_memory.json keeps tracked order")
+    finally:
+        shutil.rmtree(sandbox)
+
+    return True
+
+
+if __name__ == "__main__":
+    print("="*60)
+    print("MEMORY FILES TEST SUITE")
+    print("="*60 + "\n")
+
+    tests = [
+        test_batch_memory_files,
+        test_build_working_memory
+    ]
+    tests_passed = sum(1 for test in tests if test())
+    tests_total = len(tests)
+
+    print("\n" + "="*60)
+    print(f"RESULTS: {tests_passed}/{tests_total} tests passed")
+    print("="*60)
+
+    if tests_passed == tests_total:
+        print("✅ ALL TESTS PASSED")
+        sys.exit(0)
+    else:
+        print("❌ SOME TESTS FAILED")
+        sys.exit(1)
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Test terminal.run_commands_batch
+
+Runs real commands through one shell and checks per-command output,
+exit codes and input validation.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "tools"))
+
+import terminal
+
+
+def test_batch_output_and_exit_codes():
+    """Each command gets its own output and returncode; one failure marks the batch as error"""
+    print("Testing batch output and exit codes...")
+
+    result = terminal.run_commands_batch(["echo first", "sh -c 'exit 3'", "echo third"])
+    expected = [
+        {"command": "echo first", "returncode": 0, "output": "first"},
+        {"command": "sh -c 'exit 3'", "returncode": 3, "output": ""},
+        {"command": "echo third", "returncode": 0, "output": "third"}
+    ]
+
+    if result.get("results") != expected:
+        print(f"❌ Unexpected results: {result}")
+        return False
+    print("✅ Output and returncode recorded per command")
+
+    if result.get("status") != "error":
+        print(f"❌ Expected status 'error' after a failing command, got {result.get('status')}")
+        return False
+    print("✅ Failing command marks the batch as error")
+
+    result = terminal.run_commands_batch(["echo ok"])
+    if result.get("status") != "success":
+        print(f"❌ Expected status 'success', got {result}")
+        return False
+    print("✅ All-zero batch reports success")
+
+    return True
+
+
+def test_batch_shares_shell_state():
+    """Commands run in one shell, so cd and variables carry over"""
+    print("\nTesting shared shell state...")
+
+    result = terminal.run_commands_batch(["cd /", "NAME=batch", "pwd", "echo $NAME"])
+    outputs = [r["output"] for r in result.get("results", [])]
+
+    if outputs[2:] != ["/", "batch"]:
+        print(f"❌ Shell state not shared: {outputs}")
+        return False
+    print("✅ cwd and variables carry over between commands")
+
+    return True
+
+
+def test_batch_exit_leaves_rest_unrun():
+    """A command that exits the shell leaves later commands with no returncode"""
+    print("\nTesting early shell exit...")
+
+    result = terminal.run_commands_batch(["echo before", "exit 5", "echo after"])
+    returncodes = [r["returncode"] for r in result.get("results", [])]
+
+    if returncodes != [0, None, None]:
+        print(f"❌ Unexpected returncodes: {returncodes}")
+        return False
+    print("✅ Unrun commands report returncode None")
+
+    return True
+
+
+def test_batch_timeout():
+    """A batch past its timeout reports the commands that finished"""
+    print("\nTesting batch timeout...")
+
+    result = terminal.run_commands_batch(["echo done", "sleep 5"], timeout=1)
+    returncodes = [r["returncode"] for r in result.get("results", [])]
+
+    if result.get("status") != "error" or "timed out" not in result.get("message", ""):
+        print(f"❌ Timeout not reported: {result}")
+        return False
+
+    if returncodes != [0, None]:
+        print(f"❌ Unexpected returncodes: {returncodes}")
+        return False
+    print("✅ Timeout reported with finished commands kept")
+
+    return True
+
+
+def test_batch_rejects_bad_input():
+    """Non-list input is rejected instead of being run character by character"""
+    print("\nTesting input validation...")
+
+    for bad in ["echo hi", None, ["echo hi", 3], []]:
+        result = terminal.run_commands_batch(bad)
+        if result.get("status") != "error" or "results" in result:
+            print(f"❌ {bad!r} was not rejected: {result}")
+            return False
+    print("✅ Strings, None, non-string items and empty lists rejected")
+
+    return True
+
+
+if __name__ == "__main__":
+    print("="*60)
+    print("RUN COMMANDS BATCH TEST SUITE")
+    print("="*60 + "\n")
+
+    tests = [
+        test_batch_output_and_exit_codes,
+        test_batch_shares_shell_state,
+        test_batch_exit_leaves_rest_unrun,
+        test_batch_timeout,
+        test_batch_rejects_bad_input
+    ]
+    tests_passed = sum(1 for test in tests if test())
+    tests_total = len(tests)
+
+    print("\n" + "="*60)
+    print(f"RESULTS: {tests_passed}/{tests_total} tests passed")
+    print("="*60)
+
+    if tests_passed == tests_total:
+        print("✅ ALL TESTS PASSED")
+        sys.exit(0)
+    else:
+        print("❌ SOME TESTS FAILED")
+        sys.exit(1)
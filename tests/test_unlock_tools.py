@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Test unlock_tool.unlock_tools (bulk unlock) without JSONBin
+
+Points the ledger, identity and registry at temp copies and replaces the
+JSONBin sync calls, then checks charging, already-unlocked results, the
+insufficient-credits path and marketplace registration.
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+REPO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(REPO_DIR, "tools"))
+
+import system_settings
+import unlock_tool
+
+# force flags of the sync_from_jsonbin calls made since the last setup_sandbox
+SYNC_CALLS = []
+
+
+def setup_sandbox(credits=0, tools_unlocked=()):
+    """Fresh temp ledger + registry copy; JSONBin sync disabled"""
+    sandbox = tempfile.mkdtemp()
+
+    unlock_tool.REFERRAL_PATH = os.path.join(sandbox, "referrals.json")
+    unlock_tool.IDENTITY_PATH = os.path.join(sandbox, "system_identity.json")
+    unlock_tool.SYSTEM_REGISTRY = os.path.join(sandbox, "system_settings.ndjson")
+    shutil.copy(os.path.join(REPO_DIR, "system_settings.ndjson"), unlock_tool.SYSTEM_REGISTRY)
+    # Marketplace unlocks register through system_settings.add_tool
+    system_settings.SYSTEM_REGISTRY = unlock_tool.SYSTEM_REGISTRY
+
+    with open(unlock_tool.IDENTITY_PATH, "w") as f:
+        json.dump({"user_id": "test_user"}, f)
+    write_ledger(credits, tools_unlocked)
+
+    unlock_tool.get_user_id.cache_clear()
+    SYNC_CALLS.clear()
+    unlock_tool.sync_from_jsonbin = lambda force=False: SYNC_CALLS.append(force) or {"status": "success"}
+    unlock_tool._queue_jsonbin_sync = lambda ledger: None
+
+    return sandbox
+
+
+def write_ledger(credits, tools_unlocked=()):
+    with open(unlock_tool.REFERRAL_PATH, "w") as f:
+        json.dump({"referral_credits": credits, "tools_unlocked": list(tools_unlocked)}, f)
+
+
+def unlock_cost(*tool_names):
+    return sum(unlock_tool.find_tool_location(name)[1] for name in tool_names)
+
+
+def read_ledger():
+    with open(unlock_tool.REFERRAL_PATH) as f:
+        return json.load(f)
+
+
+def tool_header(tool_name):
+    with open(unlock_tool.SYSTEM_REGISTRY) as f:
+        entries = [json.loads(line) for line in f if line.strip()]
+    return next((e for e in entries if e.get("tool") == tool_name and e.get("action") == "__tool__"), None)
+
+
+def test_bulk_unlock_charges_once():
+    """Locked tools are charged together and get the single-unlock message"""
+    print("Testing bulk unlock charge...")
+
+    sandbox = setup_sandbox()
+
+    try:
+        write_ledger(unlock_cost("outline_editor", "mem_tool") + 1)
+
+        result = unlock_tool.unlock_tools(["outline_editor", "mem_tool"])
+        if result.get("status") != "success":
+            print(f"❌ Bulk unlock failed: {result}")
+            return False
+
+        ledger = read_ledger()
+        if ledger["referral_credits"] != 1 or set(ledger["tools_unlocked"]) != {"outline_editor", "mem_tool"}:
+            print(f"❌ Ledger not updated correctly: {ledger}")
+            return False
+        print("✅ Combined cost deducted once")
+
+        expected = unlock_tool._load_unlock_messages()["outline_editor"]["message"]
+        outline = result["results"][0]
+        if outline.get("tool") != "outline_editor" or outline.get("message") != expected:
+            print(f"❌ Missing unlock message: {outline}")
+            return False
+        print("✅ Result carries the unlock_messages.json message")
+    finally:
+        shutil.rmtree(sandbox)
+
+    return True
+
+
+def test_bulk_unlock_already_unlocked():
+    """Already-unlocked tools cost nothing and match the single already_unlocked response"""
+    print("\nTesting bulk unlock of already-unlocked tools...")
+
+    sandbox = setup_sandbox(credits=0, tools_unlocked=["outline_editor", "claude_assistant"])
+
+    try:
+        # claude_assistant only counts as pre-installed once it is in the registry
+        if unlock_tool.find_tool_location("claude_assistant")[0] != "preinstalled":
+            with open(unlock_tool.SYSTEM_REGISTRY, "a") as f:
+                f.write(json.dumps({"tool": "claude_assistant", "action": "__tool__", "locked": False}) + "\n")
+
+        result = unlock_tool.unlock_tools(["outline_editor", "claude_assistant"])
+        if result.get("status") != "success" or result.get("credits_remaining") != 0:
+            print(f"❌ Bulk unlock failed: {result}")
+            return False
+
+        for entry in result["results"]:
+            single = unlock_tool._preinstalled_already_unlocked(entry["tool"])
+            if entry != {"tool": entry["tool"], **single}:
+                print(f"❌ {entry['tool']} result differs from single unlock: {entry}")
+                return False
+        print("✅ Results match the single-unlock already_unlocked response")
+
+        if not result["results"][1].get("auth_instructions"):
+            print("❌ claude_assistant missing auth instructions")
+            return False
+        print("✅ claude_assistant includes auth instructions")
+    finally:
+        shutil.rmtree(sandbox)
+
+    return True
+
+
+def test_bulk_unlock_insufficient_credits():
+    """Nothing is charged when the combined cost exceeds the balance"""
+    print("\nTesting bulk unlock with insufficient credits...")
+
+    sandbox = setup_sandbox()
+
+    try:
+        credits = unlock_cost("outline_editor", "mem_tool") - 1
+        write_ledger(credits)
+
+        result = unlock_tool.unlock_tools(["outline_editor", "mem_tool"])
+        if "Insufficient credits" not in result.get("error", "") or result.get("credits_needed") != 1:
+            print(f"❌ Expected insufficient credits error: {result}")
+            return False
+        print("✅ Insufficient credits reported")
+
+        ledger = read_ledger()
+        if ledger["referral_credits"] != credits or ledger["tools_unlocked"]:
+            print(f"❌ Ledger changed: {ledger}")
+            return False
+        print("✅ Ledger left untouched")
+    finally:
+        shutil.rmtree(sandbox)
+
+    return True
+
+
+def test_bulk_unlock_marketplace():
+    """A marketplace tool is registered and a pre-installed one flipped to unlocked in the same call"""
+    print("\nTesting bulk unlock with a marketplace tool...")
+
+    sandbox = setup_sandbox()
+
+    try:
+        if unlock_tool.find_tool_location("notion_tool")[0] != "marketplace":
+            print("❌ notion_tool should start as a marketplace tool")
+            return False
+
+        write_ledger(unlock_cost("notion_tool", "outline_editor"))
+
+        result = unlock_tool.unlock_tools(["notion_tool", "outline_editor"])
+        if result.get("status") != "success" or result.get("credits_remaining") != 0:
+            print(f"❌ Bulk unlock failed: {result}")
+            return False
+
+        notion = result["results"][0]
+        label = unlock_tool.load_app_store()["notion_tool"].get("label", "notion_tool")
+        if notion.get("type") != "marketplace" or label not in notion.get("unlock_message", ""):
+            print(f"❌ Unexpected marketplace result: {notion}")
+            return False
+        print("✅ Marketplace result carries its unlock message")
+
+        header = tool_header("notion_tool")
+        if header is None or header.get("locked") is not False:
+            print(f"❌ notion_tool not registered as unlocked: {header}")
+            return False
+        if unlock_tool.find_tool_location("notion_tool") != ("preinstalled", 0):
+            print("❌ notion_tool not found in the registry after unlock")
+            return False
+        print("✅ Marketplace tool registered through add_tool")
+
+        header = tool_header("outline_editor")
+        if header.get("locked") is not False or not header.get("unlocked"):
+            print(f"❌ outline_editor header not flipped: {header}")
+            return False
+        print("✅ Pre-installed header marked unlocked")
+    finally:
+        shutil.rmtree(sandbox)
+
+    return True
+
+
+def test_bulk_unlock_syncs_only_when_charging():
+    """JSONBin is pulled only when a locally locked tool has a cost"""
+    print("\nTesting bulk unlock JSONBin pulls...")
+
+    sandbox = setup_sandbox(credits=0, tools_unlocked=["outline_editor", "mem_tool"])
+
+    try:
+        result = unlock_tool.unlock_tools(["outline_editor", "mem_tool"])
+        if result.get("status") != "success" or SYNC_CALLS:
+            print(f"❌ Already-unlocked batch pulled from JSONBin: {result}, {SYNC_CALLS}")
+            return False
+        print("✅ No pull when every tool is already unlocked")
+
+        result = unlock_tool.unlock_tools(["outline_editor", "readwise_tool"])
+        if "Insufficient credits" not in result.get("error", "") or len(SYNC_CALLS) != 1:
+            print(f"❌ Expected one pull before charging: {result}, {SYNC_CALLS}")
+            return False
+        print("✅ One pull when something is charged")
+    finally:
+        shutil.rmtree(sandbox)
+
+    return True
+
+
+def test_bulk_unlock_rejects_bad_input():
+    """tool_names must be a list of names"""
+    print("\nTesting bulk unlock input validation...")
+
+    for bad in ["outline_editor", None, ["outline_editor", 1]]:
+        result = unlock_tool.unlock_tools(bad)
+        if "error" not in result:
+            print(f"❌ {bad!r} was not rejected: {result}")
+            return False
+    print("✅ Non-list input rejected")
+
+    return True
+
+
+if __name__ == "__main__":
+    print("="*60)
+    print("BULK UNLOCK TEST SUITE")
+    print("="*60 + "\n")
+
+    tests = [
+        test_bulk_unlock_charges_once,
+        test_bulk_unlock_already_unlocked,
+        test_bulk_unlock_insufficient_credits,
+        test_bulk_unlock_marketplace,
+        test_bulk_unlock_syncs_only_when_charging,
+        test_bulk_unlock_rejects_bad_input
+    ]
+    tests_passed = sum(1 for test in tests if test())
+    tests_total = len(tests)
+
+    print("\n" + "="*60)
+    print(f"RESULTS: {tests_passed}/{tests_total} tests passed")
+    print("="*60)
+
+    if tests_passed == tests_total:
+        print("✅ ALL TESTS PASSED")
+        sys.exit(0)
+    else:
+        print("❌ SOME TESTS FAILED")
+        sys.exit(1)
@@ -25,14 +25,17 @@ def run_setup_script(script_path):
         # Build full path to mounted setup script
         full_script_path = os.path.join("/orchestrate_user", script_path)
 
-        if not os.path.exists(full_script_path):
+        try:
+            st = os.stat(full_script_path)
+        except FileNotFoundError:
             return {
                 "status": "error",
                 "message": f"❌ Setup script not found at {full_script_path}"
             }
 
-        # Make executable
-        os.chmod(full_script_path, 0o755)
+        # Make executable (only if it isn't already)
+        if (st.st_mode & 0o111) != 0o111:
+            os.chmod(full_script_path, st.st_mode | 0o755)
 
         print(f"🔧 Executing setup script: {full_script_path}", file=sys.stderr)
 
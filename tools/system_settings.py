@@ -8,11 +8,12 @@ Auto-refactored by refactorize.py to match gold standard structure.
 import os
 import sys
 import json
-import subprocess
+import functools
 
-import importlib.util
-import inspect
-import shutil
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -21,14 +22,88 @@ TOOLS_DIR = BASE_DIR
 CREDENTIALS_FILE = os.path.join(BASE_DIR, "credentials.json")
 
 
+_CREDS = None
+_CREDS_STAMP = None
+
+
+def _loads(data):
+    """Parse JSON from str/bytes, using orjson when it's installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj, indent=False):
+    """Serialize obj to JSON bytes, using orjson when it's installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2).encode()
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _atomic_write(path, data, fsync=False, default_mode=None):
+    """Write bytes to path via a temp file + os.replace so readers never see a partial file"""
+    # Replace the symlink's target rather than the link itself, and keep the
+    # existing file's permissions (default_mode, if given, for a new file)
+    path = os.path.realpath(path)
+    try:
+        mode = os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        mode = default_mode
+
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, 'wb') as f:
+            if mode is not None:
+                os.fchmod(f.fileno(), mode)
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        # Don't leave a stray temp file next to the target on failure
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _file_stamp(path):
+    """Return (mtime_ns, size) for path, or None if it doesn't exist"""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _load_creds():
+    """Return the in-memory credentials mirror, re-reading only when the file changed"""
+    global _CREDS, _CREDS_STAMP
+    stamp = _file_stamp(CREDENTIALS_FILE)
+    if stamp is None:
+        _CREDS, _CREDS_STAMP = {}, None
+    elif _CREDS is None or stamp != _CREDS_STAMP:
+        with open(CREDENTIALS_FILE, 'rb') as f:
+            _CREDS = _loads(f.read())
+        _CREDS_STAMP = stamp
+    return _CREDS
+
+
+def _save_creds(creds):
+    """Persist credentials and keep the mirror in sync with what's on disk"""
+    global _CREDS, _CREDS_STAMP
+    _atomic_write(CREDENTIALS_FILE, _dumps(creds, indent=True), default_mode=0o600)
+    _CREDS, _CREDS_STAMP = creds, _file_stamp(CREDENTIALS_FILE)
+
+
 def load_credential(key):
     """Load a credential from credentials.json"""
     try:
-        if not os.path.exists(CREDENTIALS_FILE):
-            return None
-        with open(CREDENTIALS_FILE, 'r') as f:
-            creds = json.load(f)
-        return creds.get(key)
+        return _load_creds().get(key)
     except Exception:
         return None
 
@@ -36,15 +111,10 @@ def load_credential(key):
 def save_credential(key, value):
     """Save a credential to credentials.json"""
     try:
-        creds = {}
-        if os.path.exists(CREDENTIALS_FILE):
-            with open(CREDENTIALS_FILE, 'r') as f:
-                creds = json.load(f)
-
+        # Copy so the mirror only changes once the write has succeeded
+        creds = dict(_load_creds())
         creds[key] = value
-
-        with open(CREDENTIALS_FILE, 'w') as f:
-            json.dump(creds, f, indent=2)
+        _save_creds(creds)
 
         return {"status": "success"}
     except Exception as e:
@@ -133,20 +203,16 @@ def set_credential(params):
     # Inject into credentials.json
     creds_path = CREDENTIALS_FILE
 
-    creds = {}
-    if os.path.exists(creds_path):
-        try:
-            with open(creds_path, "r") as f:
-                creds = json.load(f)
-        except:
-            creds = {}
+    try:
+        creds = dict(_load_creds())
+    except Exception:
+        creds = {}
 
     # Set all found keys to the same value
     for key in expected_keys:
         creds[key] = value
 
-    with open(creds_path, "w") as f:
-        json.dump(creds, f, indent=2)
+    _save_creds(creds)
 
     return {
         "status": "success",
@@ -156,26 +222,174 @@ def set_credential(params):
     }
 
 
+_REGISTRY_CACHE = {"key": None, "entries": None}
+_MEMORY_CACHE = {"key": None, "files": None}
+_INTERNED_FIELDS = ("tool", "action", "script_path")
+
+
 def load_registry():
     """Load system_settings.ndjson as list of entries"""
     try:
-        with open(SYSTEM_REGISTRY, 'r') as f:
-            return [json.loads(line.strip()) for line in f if line.strip()]
+        key = (SYSTEM_REGISTRY, _file_stamp(SYSTEM_REGISTRY))
+        if key[1] is not None and key == _REGISTRY_CACHE["key"]:
+            return list(_REGISTRY_CACHE["entries"])
+
+        with open(SYSTEM_REGISTRY, 'rb') as f:
+            lines = [line for line in f.read().splitlines() if line.strip()]
+        # One parser call over the whole file instead of one per line
+        entries = _loads(b'[' + b','.join(lines) + b']')
+
+        # Tool names and script paths repeat across every action of a tool;
+        # intern them so duplicates share one object and compare by identity
+        intern = sys.intern
+        for entry in entries:
+            for field in _INTERNED_FIELDS:
+                value = entry.get(field)
+                if type(value) is str:
+                    entry[field] = intern(value)
+
+        _REGISTRY_CACHE.update(key=key, entries=entries)
+        return list(entries)
     except Exception as e:
         return []
 
 
+def _name_needles(name):
+    """Byte forms a JSON string can take on a registry line: raw UTF-8 (orjson) and \\u-escaped (json)"""
+    return tuple({_dumps(name), json.dumps(name).encode()})
+
+
+def _scan_registry(needle, path=None):
+    """
+    Yield registry entries whose raw NDJSON line contains needle (bytes, or a tuple of alternatives)
+
+    Lines that can't match are skipped before json.loads, so filtered
+    queries only pay to parse the entries they might return. path defaults
+    to SYSTEM_REGISTRY.
+    """
+    needles = (needle,) if isinstance(needle, bytes) else needle
+    try:
+        with open(path or SYSTEM_REGISTRY, 'rb') as f:
+            for line in f:
+                if any(n in line for n in needles):
+                    try:
+                        yield _loads(line)
+                    except ValueError:
+                        continue
+    except OSError:
+        return
+
+
+def _write_registry(path, entries):
+    """Write registry entries to an NDJSON file: one buffer, fsynced, atomically replaced"""
+    _atomic_write(path, b''.join(_dumps(entry) + b'\n' for entry in entries), fsync=True)
+
+
 def save_registry(entries):
     """Save registry entries back to system_settings.ndjson"""
     try:
-        with open(SYSTEM_REGISTRY, 'w') as f:
-            for entry in entries:
-                f.write(json.dumps(entry) + '\n')
+        _write_registry(SYSTEM_REGISTRY, entries)
+        _REGISTRY_CACHE.update(key=(SYSTEM_REGISTRY, _file_stamp(SYSTEM_REGISTRY)), entries=list(entries))
         return {"status": "success"}
     except Exception as e:
         return {"error": f"Failed to save registry: {e}"}
 
 
+def _format_annotation(annotation):
+    """
+    Render a parameter annotation as a type name
+
+    Plain classes give their __name__; generics such as Optional[int] or
+    list[str] (which have no usable __name__) and string annotations are
+    rendered the way they'd be written in source.
+    """
+    if isinstance(annotation, str):
+        return annotation
+    if getattr(annotation, '__origin__', None) is None and hasattr(annotation, '__name__'):
+        return annotation.__name__
+    return repr(annotation).replace('typing.', '')
+
+
+def _signature_params(func):
+    """Describe a callable's parameters via inspect.signature (the general, slower path)"""
+    import inspect
+
+    params = []
+    for param_name, param in inspect.signature(func).parameters.items():
+        param_info = {
+            "name": param_name,
+            "required": param.default == inspect.Parameter.empty
+        }
+
+        if param.annotation != inspect.Parameter.empty:
+            param_info["type"] = _format_annotation(param.annotation)
+
+        params.append(param_info)
+
+    return tuple(params)
+
+
+@functools.cache
+def _fast_params(func):
+    """
+    Describe a function's parameters straight from its code object
+
+    Same output as walking inspect.signature(), without building
+    Signature/Parameter objects for every action.
+    """
+    import inspect
+
+    func = inspect.unwrap(func)
+
+    # Bound methods don't list self/cls, same as inspect.signature()
+    skip = 0
+    if inspect.ismethod(func):
+        func, skip = inspect.unwrap(func.__func__), 1
+
+    code = getattr(func, '__code__', None)
+    if code is None:
+        # functools.partial, classes, builtins and other callables
+        return _signature_params(func)
+
+    annotations = func.__annotations__
+    kwdefaults = func.__kwdefaults__ or {}
+
+    names = code.co_varnames
+    positional = names[:code.co_argcount]
+    end = code.co_argcount + code.co_kwonlyargcount
+    keyword_only = names[code.co_argcount:end]
+    first_default = len(positional) - len(func.__defaults__ or ())
+
+    var_positional = var_keyword = None
+    if code.co_flags & inspect.CO_VARARGS:
+        var_positional = names[end]
+        end += 1
+    if code.co_flags & inspect.CO_VARKEYWORDS:
+        var_keyword = names[end]
+
+    # inspect.signature order: positional, *args, keyword-only, **kwargs;
+    # varargs have no default, so they count as required like it reports
+    ordered = [(name, i < first_default) for i, name in enumerate(positional)][skip:]
+    if var_positional is not None:
+        ordered.append((var_positional, True))
+    ordered += [(name, name not in kwdefaults) for name in keyword_only]
+    if var_keyword is not None:
+        ordered.append((var_keyword, True))
+
+    params = []
+    for name, required in ordered:
+        param_info = {"name": name, "required": required}
+        if name in annotations:
+            param_info["type"] = _format_annotation(annotations[name])
+
+        params.append(param_info)
+
+    return tuple(params)
+
+
+_ACTION_CACHE = {}
+
+
 def extract_actions_from_script(tool_script_path):
     """
     Extract actions from tool script
@@ -183,9 +397,139 @@ def extract_actions_from_script(tool_script_path):
     Supports both:
     1. Legacy ACTIONS dict (for backward compatibility)
     2. Refactored main() if/elif router (gold standard)
+
+    Successful results are cached per (path, mtime, size), so re-registering
+    an unchanged script doesn't execute and introspect it again.
     """
+    key = (tool_script_path, _file_stamp(tool_script_path))
+    cached = _ACTION_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    result = _extract_actions(tool_script_path)
+    if key[1] is not None and "error" not in result:
+        _ACTION_CACHE[key] = result
+    return result
+
+
+def _ast_params(func):
+    """Describe a FunctionDef's parameters the same way _fast_params does"""
     import ast
-    import re
+
+    args = func.args
+    positional = args.posonlyargs + args.args
+    first_default = len(positional) - len(args.defaults)
+
+    params = []
+    arg_required = [(arg, i < first_default) for i, arg in enumerate(positional)]
+    if args.vararg is not None:
+        arg_required.append((args.vararg, True))
+    arg_required += [(arg, default is None) for arg, default in zip(args.kwonlyargs, args.kw_defaults)]
+    if args.kwarg is not None:
+        arg_required.append((args.kwarg, True))
+
+    for arg, required in arg_required:
+        param_info = {"name": arg.arg, "required": required}
+        if arg.annotation is not None:
+            param_info["type"] = ast.unparse(arg.annotation)
+        params.append(param_info)
+
+    return params
+
+
+def _router_action(node):
+    """The '<name>' of an args.action == '<name>' comparison node, else None"""
+    import ast
+
+    if (isinstance(node, ast.Compare)
+            and isinstance(node.left, ast.Attribute) and node.left.attr == 'action'
+            and isinstance(node.left.value, ast.Name) and node.left.value.id == 'args'
+            and len(node.ops) == 1 and isinstance(node.ops[0], ast.Eq)
+            and isinstance(node.comparators[0], ast.Constant)
+            and isinstance(node.comparators[0].value, str)):
+        return node.comparators[0].value
+    return None
+
+
+def _extract_actions_ast(tree):
+    """
+    Extract actions from the script's parsed tree instead of executing it
+
+    Returns None when the script can't be described statically (dynamic
+    ACTIONS, decorated or imported action functions, no router found), so
+    the caller falls back to importing the module.
+    """
+    import ast
+
+    functions = {node.name: node for node in tree.body if isinstance(node, ast.FunctionDef)}
+
+    action_funcs = None
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(isinstance(t, ast.Name) and t.id == 'ACTIONS' for t in node.targets):
+            if not isinstance(node.value, ast.Dict):
+                return None
+            action_funcs = []
+            for key, value in zip(node.value.keys, node.value.values):
+                if not (isinstance(key, ast.Constant) and isinstance(key.value, str) and isinstance(value, ast.Name)):
+                    return None
+                if value.id not in functions:
+                    return None
+                action_funcs.append((key.value, functions[value.id]))
+
+    if action_funcs is None:
+        main_func = functions.get('main')
+        if main_func is None:
+            return None
+
+        # args.action == '<name>' comparisons in the main() router
+        action_funcs = []
+        for node in ast.walk(main_func):
+            action_name = _router_action(node)
+            if action_name is None:
+                continue
+            # Routed to something that isn't a plain top-level def (async,
+            # imported, assigned) - let the import-based path resolve it
+            if action_name not in functions:
+                return None
+            action_funcs.append((action_name, functions[action_name]))
+
+        if not action_funcs:
+            return None
+
+    actions = []
+    for action_name, func in action_funcs:
+        if func.decorator_list:
+            return None
+
+        description = ast.get_docstring(func) or f"Execute {action_name}"
+        description = description.strip().split('\n')[0]
+
+        actions.append({
+            "action": action_name,
+            "description": description,
+            "parameters": _ast_params(func)
+        })
+
+    return {"status": "success", "actions": actions}
+
+
+def _extract_actions(tool_script_path):
+    """Uncached body of extract_actions_from_script"""
+    import ast
+    import importlib.util
+
+    # Parse the script once; the static pass and the main() router fallback
+    # below share the same tree
+    try:
+        with open(tool_script_path, 'rb') as f:
+            tree = ast.parse(f.read(), filename=tool_script_path)
+        result = _extract_actions_ast(tree)
+    except (OSError, SyntaxError, ValueError):
+        tree = None
+        result = None
+
+    if result is not None:
+        return result
 
     try:
         # Try loading module first for ACTIONS dict (backward compatibility)
@@ -199,19 +543,7 @@ def extract_actions_from_script(tool_script_path):
             actions = []
 
             for action_name, action_func in actions_dict.items():
-                sig = inspect.signature(action_func)
-                params = []
-
-                for param_name, param in sig.parameters.items():
-                    param_info = {
-                        "name": param_name,
-                        "required": param.default == inspect.Parameter.empty
-                    }
-
-                    if param.annotation != inspect.Parameter.empty:
-                        param_info["type"] = param.annotation.__name__
-
-                    params.append(param_info)
+                params = list(_fast_params(action_func))
 
                 description = action_func.__doc__ or f"Execute {action_name}"
                 description = description.strip().split('\n')[0]
@@ -225,10 +557,8 @@ def extract_actions_from_script(tool_script_path):
             return {"status": "success", "actions": actions}
 
         # No ACTIONS dict - parse main() function for refactored tools
-        with open(tool_script_path, 'r') as f:
-            content = f.read()
-
-        tree = ast.parse(content)
+        if tree is None:
+            return {"error": "Failed to extract actions: script could not be parsed"}
 
         # Find main() function
         main_func = None
@@ -242,42 +572,23 @@ def extract_actions_from_script(tool_script_path):
 
         # Extract action names from if/elif chain
         actions = []
-        action_pattern = re.compile(r"args\.action\s*==\s*['\"]([a-zA-Z0-9_]+)['\"]")
 
         for node in ast.walk(main_func):
-            if isinstance(node, ast.Compare):
-                # Convert node back to source to check pattern
+            action_name = _router_action(node)
+            # Try to find function with this name in module
+            if action_name is not None and hasattr(module, action_name):
                 try:
-                    line = ast.get_source_segment(content, node)
-                    match = action_pattern.search(line)
-                    if match:
-                        action_name = match.group(1)
-
-                        # Try to find function with this name in module
-                        if hasattr(module, action_name):
-                            action_func = getattr(module, action_name)
-                            sig = inspect.signature(action_func)
-                            params = []
-
-                            for param_name, param in sig.parameters.items():
-                                param_info = {
-                                    "name": param_name,
-                                    "required": param.default == inspect.Parameter.empty
-                                }
-
-                                if param.annotation != inspect.Parameter.empty:
-                                    param_info["type"] = param.annotation.__name__
-
-                                params.append(param_info)
-
-                            description = action_func.__doc__ or f"Execute {action_name}"
-                            description = description.strip().split('\n')[0]
-
-                            actions.append({
-                                "action": action_name,
-                                "description": description,
-                                "parameters": params
-                            })
+                    action_func = getattr(module, action_name)
+                    params = list(_fast_params(action_func))
+
+                    description = action_func.__doc__ or f"Execute {action_name}"
+                    description = description.strip().split('\n')[0]
+
+                    actions.append({
+                        "action": action_name,
+                        "description": description,
+                        "parameters": params
+                    })
                 except:
                     pass
 
@@ -458,7 +769,7 @@ def remove_action(params):
     registry = load_registry()
 
     original_count = len(registry)
-    registry = [entry for entry in registry 
+    registry = [entry for entry in registry
                 if not (entry.get("tool") == tool_name and entry.get("action") == action_name)]
     removed_count = original_count - len(registry)
 
@@ -477,10 +788,8 @@ def remove_action(params):
 
 def list_tools(params):
     """List all registered tools"""
-    registry = load_registry()
-
     tools = {}
-    for entry in registry:
+    for entry in _scan_registry(b'"__tool__"'):
         if entry.get("action") == "__tool__":
             tool_name = entry.get("tool")
             tools[tool_name] = {
@@ -496,11 +805,23 @@ def list_tools(params):
 
 
 def list_supported_actions(params):
-    """List all actions in the system"""
-    registry = load_registry()
+    """
+    List all actions in the system
+
+    Optional:
+    - tool_name: only list actions for this tool
+    """
+    tool_name = params.get("tool_name")
+
+    if tool_name:
+        registry = _scan_registry(_name_needles(tool_name))
+    else:
+        registry = load_registry()
 
     actions = []
     for entry in registry:
+        if tool_name and entry.get("tool") != tool_name:
+            continue
         if entry.get("action") != "__tool__":
             actions.append({
                 "tool": entry.get("tool"),
@@ -515,6 +836,26 @@ def list_supported_actions(params):
     }
 
 
+def _load_memory_files(memory_config):
+    """Load the tracked memory file list (None if not configured), reusing the parsed copy while unchanged"""
+    key = (memory_config, _file_stamp(memory_config))
+    if key[1] is None:
+        return None
+
+    if key != _MEMORY_CACHE["key"]:
+        with open(memory_config, 'rb') as f:
+            _MEMORY_CACHE.update(key=key, files=_loads(f.read()))
+
+    return list(_MEMORY_CACHE["files"])
+
+
+def _save_memory_files(memory_config, memory_files):
+    """Write the tracked memory file list and refresh the cache"""
+    os.makedirs(os.path.dirname(memory_config), exist_ok=True)
+    _atomic_write(memory_config, _dumps(memory_files, indent=True))
+    _MEMORY_CACHE.update(key=(memory_config, _file_stamp(memory_config)), files=list(memory_files))
+
+
 def add_memory_file(params):
     """
     Add a file to memory tracking
@@ -529,17 +870,12 @@ def add_memory_file(params):
 
     memory_config = os.path.join(BASE_DIR, "data", "memory_files.json")
 
-    memory_files = []
-    if os.path.exists(memory_config):
-        with open(memory_config, 'r') as f:
-            memory_files = json.load(f)
+    memory_files = _load_memory_files(memory_config) or []
 
     if path not in memory_files:
         memory_files.append(path)
 
-    os.makedirs(os.path.dirname(memory_config), exist_ok=True)
-    with open(memory_config, 'w') as f:
-        json.dump(memory_files, f, indent=2)
+    _save_memory_files(memory_config, memory_files)
 
     return {
         "status": "success",
@@ -561,19 +897,16 @@ def remove_memory_file(params):
 
     memory_config = os.path.join(BASE_DIR, "data", "memory_files.json")
 
-    if not os.path.exists(memory_config):
+    memory_files = _load_memory_files(memory_config)
+    if memory_files is None:
         return {"status": "error", "message": "No memory files configured"}
 
-    with open(memory_config, 'r') as f:
-        memory_files = json.load(f)
-
     if path not in memory_files:
         return {"status": "error", "message": f"Path '{path}' not in memory tracking"}
 
     memory_files.remove(path)
 
-    with open(memory_config, 'w') as f:
-        json.dump(memory_files, f, indent=2)
+    _save_memory_files(memory_config, memory_files)
 
     return {
         "status": "success",
@@ -581,50 +914,96 @@ def remove_memory_file(params):
     }
 
 
+def batch_memory_files(params):
+    """
+    Add and remove several tracked memory files in one read/write
+
+    Optional:
+    - add: list of file paths to track
+    - remove: list of file paths to stop tracking
+    """
+    to_add = params.get("add", [])
+    to_remove = params.get("remove", [])
+
+    for key, paths in (("add", to_add), ("remove", to_remove)):
+        if not isinstance(paths, list) or not all(isinstance(path, str) for path in paths):
+            return {"status": "error", "message": f"'{key}' must be a list of file paths"}
+
+    if not to_add and not to_remove:
+        return {"status": "error", "message": "Nothing to do: pass 'add' and/or 'remove'"}
+
+    memory_config = os.path.join(BASE_DIR, "data", "memory_files.json")
+
+    memory_files = _load_memory_files(memory_config) or []
+
+    added = []
+    for path in to_add:
+        if path not in memory_files:
+            memory_files.append(path)
+            added.append(path)
+
+    removed = []
+    not_tracked = []
+    for path in to_remove:
+        if path in memory_files:
+            memory_files.remove(path)
+            removed.append(path)
+        else:
+            not_tracked.append(path)
+
+    _save_memory_files(memory_config, memory_files)
+
+    return {
+        "status": "success",
+        "added": added,
+        "removed": removed,
+        "not_tracked": not_tracked
+    }
+
+
 def list_memory_files(params):
     """List all memory tracked files"""
     memory_config = os.path.join(BASE_DIR, "data", "memory_files.json")
 
-    if not os.path.exists(memory_config):
+    memory_files = _load_memory_files(memory_config)
+    if memory_files is None:
         return {"status": "success", "memory_files": []}
 
-    with open(memory_config, 'r') as f:
-        memory_files = json.load(f)
-
     return {"status": "success", "memory_files": memory_files}
 
 
+def _load_memory_entry(file_path):
+    """Read one tracked file for build_working_memory as (file_path, loaded, data)"""
+    try:
+        with open(os.path.join(BASE_DIR, file_path), 'rb') as f:
+            return file_path, True, _loads(f.read())
+    except Exception:
+        return file_path, False, None
+
+
 def build_working_memory(params):
     """Build working memory from tracked files"""
     memory_config = os.path.join(BASE_DIR, "data", "memory_files.json")
 
-    if not os.path.exists(memory_config):
+    memory_files = _load_memory_files(memory_config)
+    if memory_files is None:
         return {
             "status": "success",
             "message": "No memory files configured",
             "working_memory": {}
         }
 
-    with open(memory_config, 'r') as f:
-        memory_files = json.load(f)
+    # File reads are I/O bound, so load them concurrently and merge in tracked order
+    from concurrent.futures import ThreadPoolExecutor
 
-    working_memory = {}
-
-    for file_path in memory_files:
-        full_path = os.path.join(BASE_DIR, file_path)
-        if os.path.exists(full_path):
-            try:
-                with open(full_path, 'r') as f:
-                    data = json.load(f)
-                    working_memory[file_path] = data
-            except Exception:
-                pass
+    with ThreadPoolExecutor(max_workers=min(8, len(memory_files) or 1)) as pool:
+        loaded = pool.map(_load_memory_entry, memory_files)
+        working_memory = {file_path: data for file_path, ok, data in loaded if ok}
 
     # Save to working_memory.json
     output_path = os.path.join(BASE_DIR, "data", "working_memory.json")
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, 'w') as f:
-        json.dump(working_memory, f, indent=2)
+    _atomic_write(output_path, _dumps(working_memory, indent=True))
 
     return {
         "status": "success",
@@ -647,17 +1026,21 @@ def refresh_runtime(params):
     - orchestrate_app_store.json
     - System messages
     """
+    import subprocess
+
     try:
         # Save user state
         referral_path = os.path.join(BASE_DIR, "container_state", "referrals.json")
         unlocked_tools = set()
         user_credits = 0
 
-        if os.path.exists(referral_path):
-            with open(referral_path, 'r') as f:
-                referral_data = json.load(f)
+        try:
+            with open(referral_path, 'rb') as f:
+                referral_data = _loads(f.read())
                 unlocked_tools = set(referral_data.get("tools_unlocked", []))
                 user_credits = referral_data.get("referral_credits", 0)
+        except FileNotFoundError:
+            pass
 
         # Git pull
         result = subprocess.run(
@@ -670,14 +1053,24 @@ def refresh_runtime(params):
         if result.returncode != 0:
             return {"error": "Git pull failed", "details": result.stderr}
 
-        # Restore unlock status
-        registry = load_registry()
-        for entry in registry:
-            tool_name = entry.get("tool")
-            if entry.get("action") == "__tool__" and tool_name in unlocked_tools:
-                entry["unlocked"] = True
-
-        save_registry(registry)
+        # Restore unlock status - only rewrite the registry if a flag actually flipped
+        if unlocked_tools:
+            registry = load_registry()
+            headers = {}
+            for entry in registry:
+                if entry.get("action") == "__tool__":
+                    headers.setdefault(entry.get("tool"), []).append(entry)
+
+            dirty = False
+            for tool_name in unlocked_tools:
+                for header in headers.get(tool_name, ()):
+                    if not header.get("unlocked") or header.get("locked"):
+                        header["unlocked"] = True
+                        header["locked"] = False
+                        dirty = True
+
+            if dirty:
+                save_registry(registry)
 
         return {
             "status": "success",
@@ -692,6 +1085,39 @@ def refresh_runtime(params):
         return {"error": f"Runtime refresh failed: {e}"}
 
 
+ACTIONS = {
+    "add_action": add_action,
+    "add_memory_file": add_memory_file,
+    "add_tool": add_tool,
+    "batch_memory_files": batch_memory_files,
+    "build_working_memory": build_working_memory,
+    "extract_actions_from_script": extract_actions_from_script,
+    "list_memory_files": list_memory_files,
+    "list_supported_actions": list_supported_actions,
+    "list_tools": list_tools,
+    "load_credential": load_credential,
+    "load_registry": load_registry,
+    "refresh_runtime": refresh_runtime,
+    "remove_action": remove_action,
+    "remove_memory_file": remove_memory_file,
+    "remove_tool": remove_tool,
+    "save_credential": save_credential,
+    "save_registry": save_registry,
+    "set_credential": set_credential
+}
+
+# Actions called with their params as keyword arguments rather than one params dict
+KWARG_ACTIONS = {
+    "extract_actions_from_script",
+    "load_credential",
+    "save_credential",
+    "save_registry"
+}
+
+# Actions that take no arguments at all
+NO_PARAM_ACTIONS = {"load_registry"}
+
+
 def main():
     import argparse
     import json
@@ -702,42 +1128,15 @@ def main():
     args = parser.parse_args()
     params = json.loads(args.params) if args.params else {}
 
-    if args.action == 'add_action':
-        result = add_action(params)
-    elif args.action == 'add_memory_file':
-        result = add_memory_file(params)
-    elif args.action == 'add_tool':
-        result = add_tool(params)
-    elif args.action == 'build_working_memory':
-        result = build_working_memory(params)
-    elif args.action == 'extract_actions_from_script':
-        result = extract_actions_from_script(**params)
-    elif args.action == 'list_memory_files':
-        result = list_memory_files(params)
-    elif args.action == 'list_supported_actions':
-        result = list_supported_actions(params)
-    elif args.action == 'list_tools':
-        result = list_tools(params)
-    elif args.action == 'load_credential':
-        result = load_credential(**params)
-    elif args.action == 'load_registry':
-        result = load_registry()
-    elif args.action == 'refresh_runtime':
-        result = refresh_runtime(params)
-    elif args.action == 'remove_action':
-        result = remove_action(params)
-    elif args.action == 'remove_memory_file':
-        result = remove_memory_file(params)
-    elif args.action == 'remove_tool':
-        result = remove_tool(params)
-    elif args.action == 'save_credential':
-        result = save_credential(**params)
-    elif args.action == 'save_registry':
-        result = save_registry(**params)
-    elif args.action == 'set_credential':
-        result = set_credential(params)
-    else:
+    fn = ACTIONS.get(args.action)
+    if fn is None:
         result = {'status': 'error', 'message': f'Unknown action {args.action}'}
+    elif args.action in NO_PARAM_ACTIONS:
+        result = fn()
+    elif args.action in KWARG_ACTIONS:
+        result = fn(**params)
+    else:
+        result = fn(params)
 
     print(json.dumps(result, indent=2))
 
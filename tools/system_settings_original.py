@@ -588,28 +588,41 @@ ACTIONS = {
 
 def execute_action(action, params):
     """Execute system_settings action"""
-    if action not in ACTIONS:
+    fn = ACTIONS.get(action)
+    if fn is None:
         return {"error": f"Unknown action: {action}"}
-    
+
     try:
-        return ACTIONS[action](params)
+        return fn(params)
     except Exception as e:
         return {"error": f"Action execution failed: {e}"}
 
 
-if __name__ == "__main__":
-    import argparse
+def _parse_argv(argv):
+    """Pull <action> and --params out of argv without paying for argparse"""
+    if not argv:
+        return None, '{}'
 
-    parser = argparse.ArgumentParser()
-    parser.add_argument('action', help='Action to perform')
-    parser.add_argument('--params', type=str, help='JSON params', default='{}')
-    args = parser.parse_args()
+    action, raw_params = argv[0], '{}'
+    rest = argv[1:]
+    for i, arg in enumerate(rest):
+        if arg == '--params' and i + 1 < len(rest):
+            raw_params = rest[i + 1]
+        elif arg.startswith('--params='):
+            raw_params = arg[len('--params='):]
 
-    params = json.loads(args.params)
+    return action, raw_params
+
+
+if __name__ == "__main__":
+    action, raw_params = _parse_argv(sys.argv[1:])
 
-    if args.action in ACTIONS:
-        result = ACTIONS[args.action](params)
+    if action is None:
+        result = {"error": "Usage: system_settings.py <action> [--params JSON]"}
     else:
-        result = {"error": f"Unknown action: {args.action}"}
+        try:
+            result = execute_action(action, json.loads(raw_params))
+        except ValueError as e:
+            result = {"error": f"Invalid --params JSON: {e}"}
 
     print(json.dumps(result, indent=2))
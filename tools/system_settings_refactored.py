@@ -8,11 +8,6 @@ Auto-refactored by refactorize.py to match gold standard structure.
 import os
 import sys
 import json
-import subprocess
-
-import importlib.util
-import inspect
-import shutil
 
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -105,6 +100,9 @@ def save_registry(entries):
 
 def extract_actions_from_script(tool_script_path):
     """Extract actions from tool script by looking for ACTIONS dict"""
+    import importlib.util
+    import inspect
+
     try:
         spec = importlib.util.spec_from_file_location("tool_module", tool_script_path)
         module = importlib.util.module_from_spec(spec)
@@ -503,6 +501,8 @@ def refresh_runtime(params):
     - orchestrate_app_store.json
     - System messages
     """
+    import subprocess
+
     try:
         # Save user state
         referral_path = os.path.join(BASE_DIR, "container_state", "referrals.json")
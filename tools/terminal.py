@@ -7,103 +7,208 @@ Auto-refactored by refactorize.py to match gold standard structure.
 
 import sys
 import json
+import argparse
 import os
+import re
+import secrets
+import shlex
 import subprocess
 
 
+# Anything here needs /bin/sh: pipes, redirects, chaining, expansions, globs
+SHELL_CHARS = frozenset('|&;<>()$`\\*?[]{}~#\n')
+
+
+DANGEROUS_PATTERNS = ["rm -rf", "shutdown", "reboot", ":(){:|:&};:", "mkfs"]
+
+# One alternation scanned in a single pass, however many patterns are listed
+_DANGEROUS_RE = re.compile("|".join(re.escape(p) for p in DANGEROUS_PATTERNS))
+
+BATCH_TIMEOUT = 300  # seconds a whole run_commands_batch may take
+
+
+def _split_command(command):
+    """Return argv for a command that needs no shell features, else None"""
+    if any(c in SHELL_CHARS for c in command):
+        return None
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        return None
+    # VAR=value prefixes are shell syntax too
+    if not argv or '=' in argv[0]:
+        return None
+    return argv
+
+
+def _check_output(command):
+    """check_output that only spawns a shell when the command actually needs one"""
+    argv = _split_command(command)
+    if argv is not None:
+        try:
+            return subprocess.check_output(argv, stderr=subprocess.STDOUT, text=True)
+        except OSError:
+            pass  # builtin (cd, export...) or not on PATH - let the shell run/report it
+    return subprocess.check_output(command, shell=True, stderr=subprocess.STDOUT, text=True)
+
+
 def run_terminal_command(command):
-    import subprocess
-    
     try:
-        result = subprocess.check_output(command, shell=True, stderr=subprocess.STDOUT, text=True)
+        result = _check_output(command)
         return {"status": "success", "output": result}
     except subprocess.CalledProcessError as e:
         return {"status": "error", "message": e.output.strip()}
 
 
+def run_commands_batch(commands, timeout=BATCH_TIMEOUT):
+    """
+    Run several commands in order inside one shell process
+
+    Commands share shell state (cwd, variables), and the sequence pays for a
+    single shell start instead of one per command.
+    """
+    if not isinstance(commands, list) or not all(isinstance(cmd, str) for cmd in commands):
+        return {"status": "error", "message": "❌ commands must be a list of strings"}
+    if not commands:
+        return {"status": "error", "message": "❌ No commands given"}
+
+    marker = f"__ORCH_END_{secrets.token_hex(8)}__"
+    script = "".join(f"{cmd}\nprintf '\\n{marker}%s\\n' \"$?\"\n" for cmd in commands)
+
+    timed_out = False
+    try:
+        stdout = subprocess.run(
+            ["/bin/sh", "-c", script],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            timeout=timeout
+        ).stdout
+    except subprocess.TimeoutExpired as e:
+        # Report what finished; the command that hung and the rest get no returncode
+        timed_out = True
+        stdout = e.stdout or ""
+        if isinstance(stdout, bytes):
+            stdout = stdout.decode("utf-8", "replace")
+
+    results = []
+    output = []
+    for line in stdout.splitlines():
+        if line.startswith(marker):
+            results.append({
+                "command": commands[len(results)],
+                "returncode": int(line[len(marker):]),
+                "output": "\n".join(output).strip()
+            })
+            output = []
+        else:
+            output.append(line)
+
+    # A command that exits the shell leaves the rest unrun
+    for cmd in commands[len(results):]:
+        results.append({"command": cmd, "returncode": None, "output": "\n".join(output).strip()})
+        output = []
+
+    status = "success" if all(r["returncode"] == 0 for r in results) else "error"
+    result = {"status": status, "results": results}
+    if timed_out:
+        result["message"] = f"❌ Batch timed out after {timeout}s"
+    return result
+
+
 def run_script_file(path):
-    import subprocess
-    import os
-    
     if not os.path.exists(path):
         return {"status": "error", "message": f"❌ File not found: {path}"}
     
     try:
-        result = subprocess.check_output(path, shell=True, stderr=subprocess.STDOUT, text=True)
+        result = _check_output(path)
         return {"status": "success", "output": result}
     except subprocess.CalledProcessError as e:
         return {"status": "error", "message": e.output.strip()}
 
 
 def stream_terminal_output(command):
-    import subprocess
-    
-    process = subprocess.Popen(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
-    output = ""
-    for line in process.stdout:
-        output += line
-    process.wait()
+    argv = _split_command(command)
+    popen_kwargs = {"stdout": subprocess.PIPE, "stderr": subprocess.STDOUT}
+    try:
+        if argv is None:
+            raise OSError
+        process = subprocess.Popen(argv, **popen_kwargs)
+    except OSError:
+        process = subprocess.Popen(command, shell=True, **popen_kwargs)
+
+    # communicate() drains the pipe in large chunks into one buffer
+    output, _ = process.communicate()
     
-    return {"status": "success", "output": output.strip()}
+    return {"status": "success", "output": output.decode("utf-8", "replace").strip()}
 
 
 def sanitize_command(command):
-    dangerous = ["rm -rf", "shutdown", "reboot", ":(){:|:&};:", "mkfs"]
-    
-    if any(d in command for d in dangerous):
+    if _DANGEROUS_RE.search(command):
         return {"status": "error", "message": "❌ Unsafe command blocked."}
     
     return {"status": "success", "message": "✅ Command is safe."}
 
 
 def get_last_n_lines_of_output(command, n):
-    import subprocess
-    
     try:
-        output = subprocess.check_output(command, shell=True, stderr=subprocess.STDOUT, text=True)
+        output = _check_output(command)
         lines = output.strip().splitlines()
         return {"status": "success", "output": "\n".join(lines[-int(n):])}
     except subprocess.CalledProcessError as e:
         return {"status": "error", "message": e.output.strip()}
 
 
-def list_directory_contents(path):
-    import os
-    
+def list_directory_contents(path, details=False):
     if not os.path.exists(path):
         return {"status": "error", "message": f"❌ Path not found: {path}"}
     
     try:
-        items = os.listdir(path)
+        if not details:
+            return {"status": "success", "items": os.listdir(path)}
+
+        # is_dir comes from the d_type scandir already read; size still needs
+        # one lstat per entry, so it's only gathered when details are asked for
+        items = []
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    items.append({
+                        "name": entry.name,
+                        "is_dir": entry.is_dir(follow_symlinks=False),
+                        "size": entry.stat(follow_symlinks=False).st_size
+                    })
+                except OSError:
+                    items.append({"name": entry.name, "is_dir": None, "size": None})
         return {"status": "success", "items": items}
     except Exception as e:
         return {"status": "error", "message": str(e)}
 
 
-def main():
-    import argparse
-    import json
+ACTIONS = {
+    "get_last_n_lines_of_output": get_last_n_lines_of_output,
+    "list_directory_contents": list_directory_contents,
+    "run_commands_batch": run_commands_batch,
+    "run_script_file": run_script_file,
+    "run_terminal_command": run_terminal_command,
+    "sanitize_command": sanitize_command,
+    "stream_terminal_output": stream_terminal_output
+}
+
 
+def main():
     parser = argparse.ArgumentParser()
     parser.add_argument('action')
     parser.add_argument('--params')
     args = parser.parse_args()
     params = json.loads(args.params) if args.params else {}
 
-    if args.action == 'get_last_n_lines_of_output':
-        result = get_last_n_lines_of_output(**params)
-    elif args.action == 'list_directory_contents':
-        result = list_directory_contents(**params)
-    elif args.action == 'run_script_file':
-        result = run_script_file(**params)
-    elif args.action == 'run_terminal_command':
-        result = run_terminal_command(**params)
-    elif args.action == 'sanitize_command':
-        result = sanitize_command(**params)
-    elif args.action == 'stream_terminal_output':
-        result = stream_terminal_output(**params)
-    else:
+    fn = ACTIONS.get(args.action)
+    if fn is None:
         result = {'status': 'error', 'message': f'Unknown action {args.action}'}
+    else:
+        result = fn(**params)
 
     print(json.dumps(result, indent=2))
 
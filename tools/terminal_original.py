@@ -1,13 +1,13 @@
 
 import os
+import json
+import argparse
 import subprocess
 
 
 # --- Core Functions ---
 
 def run_terminal_command(command):
-    import subprocess
-    
     try:
         result = subprocess.check_output(command, shell=True, stderr=subprocess.STDOUT, text=True)
         return {"status": "success", "output": result}
@@ -15,9 +15,6 @@ def run_terminal_command(command):
         return {"status": "error", "message": e.output.strip()}
 
 def run_script_file(path):
-    import subprocess
-    import os
-    
     if not os.path.exists(path):
         return {"status": "error", "message": f"❌ File not found: {path}"}
     
@@ -28,8 +25,6 @@ def run_script_file(path):
         return {"status": "error", "message": e.output.strip()}
 
 def stream_terminal_output(command):
-    import subprocess
-    
     process = subprocess.Popen(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
     output = ""
     for line in process.stdout:
@@ -47,8 +42,6 @@ def sanitize_command(command):
     return {"status": "success", "message": "✅ Command is safe."}
 
 def get_last_n_lines_of_output(command, n):
-    import subprocess
-    
     try:
         output = subprocess.check_output(command, shell=True, stderr=subprocess.STDOUT, text=True)
         lines = output.strip().splitlines()
@@ -57,8 +50,6 @@ def get_last_n_lines_of_output(command, n):
         return {"status": "error", "message": e.output.strip()}
 
 def list_directory_contents(path):
-    import os
-    
     if not os.path.exists(path):
         return {"status": "error", "message": f"❌ Path not found: {path}"}
     
@@ -72,7 +63,6 @@ def list_directory_contents(path):
 
 # --- Action Router ---
 if __name__ == "__main__":
-    import argparse, json
     parser = argparse.ArgumentParser()
     parser.add_argument("action")
     parser.add_argument("--params")
@@ -7,13 +7,45 @@ Auto-refactored by refactorize.py to match gold standard structure.
 
 import os
 import sys
+import shlex
 import subprocess
 import json
 
+# Characters that mean the command needs a real shell (pipes, redirects, globs, expansions...)
+SHELL_CHARS = frozenset('|&;<>()$`\\*?[]{}~#\n')
+
 
 def run_terminal_command(command):
-    result = subprocess.getoutput(command)
-    return {"status": "success", "output": result}
+    argv = None
+    if not any(c in SHELL_CHARS for c in command):
+        try:
+            argv = shlex.split(command)
+        except ValueError:
+            pass
+        # VAR=value prefixes are shell syntax too
+        if not argv or '=' in argv[0]:
+            argv = None
+
+    # stderr stays merged into output, as it was with subprocess.getoutput
+    result = None
+    if argv is not None:
+        try:
+            result = subprocess.run(argv, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        except OSError:
+            pass  # builtin (cd, export...) or not on PATH - let the shell run/report it
+    if result is None:
+        result = subprocess.run(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+
+    return {
+        "status": "success" if result.returncode == 0 else "error",
+        "output": result.stdout.rstrip("\n"),
+        "rc": result.returncode
+    }
+
+
+ACTIONS = {
+    "run_terminal_command": run_terminal_command
+}
 
 
 def main():
@@ -26,10 +58,11 @@ def main():
     args = parser.parse_args()
     params = json.loads(args.params) if args.params else {}
 
-    if args.action == 'run_terminal_command':
-        result = run_terminal_command(**params)
-    else:
+    fn = ACTIONS.get(args.action)
+    if fn is None:
         result = {'status': 'error', 'message': f'Unknown action {args.action}'}
+    else:
+        result = fn(**params)
 
     print(json.dumps(result, indent=2))
 
@@ -8,10 +8,14 @@ Auto-refactored by refactorize.py to match gold standard structure.
 import os
 import sys
 import json
-import subprocess
-
-import requests
-from datetime import datetime
+import atexit
+import copy
+import fcntl
+import functools
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
 
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -20,112 +24,336 @@ APP_STORE_PATH = os.path.join(RUNTIME_DIR, "data", "orchestrate_app_store.json")
 REFERRAL_PATH = "/container_state/referrals.json"
 IDENTITY_PATH = "/container_state/system_identity.json"
 SYSTEM_REGISTRY = os.path.join(RUNTIME_DIR, "system_settings.ndjson")
+
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+from system_settings import (
+    add_tool, _atomic_write, _dumps, _file_stamp, _loads, _name_needles, _scan_registry, _write_registry
+)
+from setup_script_runner import run_setup_script as execute_setup
 JSONBIN_ID = "68292fcf8561e97a50162139"
 JSONBIN_KEY = "$2a$10$MoavwaWsCucy2FkU/5ycV.lBTPWoUq4uKHhCi9Y47DOHWyHFL3o2C"
+JSONBIN_TIMEOUT = (3.05, 10)  # (connect, read) seconds
+JSONBIN_CACHE_TTL = 5  # seconds a fetched record may stand in for a fresh GET
+SYNC_TTL = 30  # seconds after a successful pull before sync_from_jsonbin pulls again
+
+
+# Parsed config files keyed by path -> ((mtime_ns, size), data), so one
+# unlock doesn't re-parse the same unchanged file several times
+_FILE_CACHE = {}
+
+
+def _cached_load(path, parse):
+    """Return parse(path), reusing the last result while the file is unchanged"""
+    stamp = _file_stamp(path)
+    cached = _FILE_CACHE.get(path)
+    if stamp is not None and cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    data = parse(path)
+    if stamp is not None:
+        _FILE_CACHE[path] = (stamp, data)
+    return data
+
+
+def _is_cached(path):
+    """True if _cached_load(path, ...) would return without re-parsing"""
+    cached = _FILE_CACHE.get(path)
+    return cached is not None and cached[0] == _file_stamp(path)
+
+
+def _parse_json(path):
+    """Parse a JSON file"""
+    with open(path, 'rb') as f:
+        return _loads(f.read())
+
+
+def _parse_ndjson(path):
+    """Parse an NDJSON file into a list of entries"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    # One parser call over the whole file instead of one per line; blank
+    # lines are dropped by filter(bytes.strip, ...) without a Python-level loop
+    return _loads(b'[' + b','.join(filter(bytes.strip, data.splitlines())) + b']')
 
 
 def load_app_store():
     """Load app store configuration"""
     try:
-        with open(APP_STORE_PATH, 'r') as f:
-            data = json.load(f)
-            return data.get("entries", {})
-    except Exception as e:
+        data = _cached_load(APP_STORE_PATH, _parse_json)
+        return data.get("entries", {})
+    except (OSError, ValueError):
+        return {}
+
+
+_APP_STORE_ORDER = {"entries": None, "items": None}
+
+
+def _app_store_by_priority(app_store):
+    """App store (name, config) pairs sorted by priority, re-sorted only when the cached app store changes"""
+    if _APP_STORE_ORDER["entries"] is not app_store:
+        items = sorted(app_store.items(), key=lambda item: item[1].get("priority", 999))
+        _APP_STORE_ORDER.update(entries=app_store, items=items)
+    return _APP_STORE_ORDER["items"]
+
+
+def _load_unlock_messages():
+    """Load per-tool unlock messages from data/unlock_messages.json ({} if missing or unreadable)"""
+    unlock_messages_path = os.path.join(RUNTIME_DIR, "data", "unlock_messages.json")
+    # Messages are read after credits are charged, so a bad file must not raise
+    try:
+        return _cached_load(unlock_messages_path, _parse_json)
+    except (OSError, ValueError):
         return {}
 
 
 def load_registry():
     """Load system_settings.ndjson"""
     try:
-        with open(SYSTEM_REGISTRY, 'r') as f:
-            return [json.loads(line.strip()) for line in f if line.strip()]
-    except Exception as e:
+        return list(_cached_load(SYSTEM_REGISTRY, _parse_ndjson))
+    except (OSError, ValueError):
         return []
 
 
+_REGISTRY_INDEX = {"entries": None, "index": {}}
+
+
+def _registry_index():
+    """
+    Map (tool, action) -> registry entry (first one wins); headers are (tool, "__tool__")
+
+    Built once per cached registry load. The entries are the same objects
+    load_registry() hands out, so an entry changed through this map is
+    saved by save_registry(load_registry()).
+    """
+    try:
+        entries = _cached_load(SYSTEM_REGISTRY, _parse_ndjson)
+    except (OSError, ValueError):
+        return {}
+
+    if _REGISTRY_INDEX["entries"] is not entries:
+        index = {}
+        for entry in entries:
+            index.setdefault((entry.get("tool"), entry.get("action")), entry)
+        _REGISTRY_INDEX.update(entries=entries, index=index)
+    return _REGISTRY_INDEX["index"]
+
+
 def save_registry(entries):
     """Save system_settings.ndjson"""
     try:
-        with open(SYSTEM_REGISTRY, 'w') as f:
-            for entry in entries:
-                f.write(json.dumps(entry) + '\n')
+        _write_registry(SYSTEM_REGISTRY, entries)
+        _FILE_CACHE[SYSTEM_REGISTRY] = (_file_stamp(SYSTEM_REGISTRY), list(entries))
         return {"status": "success"}
-    except Exception as e:
+    except (OSError, TypeError) as e:
         return {"error": f"Failed to save registry: {e}"}
 
 
 def load_local_ledger():
-    """Load user's local referral ledger"""
+    """Load user's local referral ledger (fresh from disk, safe to modify)"""
     try:
-        with open(REFERRAL_PATH, 'r') as f:
-            return json.load(f)
-    except Exception as e:
+        return _parse_json(REFERRAL_PATH)
+    except (OSError, ValueError) as e:
+        return {"error": f"Failed to load local ledger: {e}"}
+
+
+def _read_local_ledger():
+    """
+    Read-only view of the local ledger, cached while referrals.json is unchanged
+
+    Callers must not modify the returned dict; the unlock path uses
+    load_local_ledger() for its read-modify-write.
+    """
+    try:
+        return _cached_load(REFERRAL_PATH, _parse_json)
+    except (OSError, ValueError) as e:
         return {"error": f"Failed to load local ledger: {e}"}
 
 
 def save_local_ledger(ledger):
-    """Save updated local ledger"""
+    """Save updated local ledger (compact JSON, fsynced, atomically replaced)"""
     try:
-        with open(REFERRAL_PATH, 'w') as f:
-            json.dump(ledger, f, indent=2)
+        _atomic_write(REFERRAL_PATH, _dumps(ledger), fsync=True)
         return {"status": "success"}
-    except Exception as e:
+    except (OSError, TypeError) as e:
         return {"error": f"Failed to save local ledger: {e}"}
 
 
+@contextmanager
+def _ledger_lock():
+    """Hold an exclusive flock on the ledger's sidecar lock file"""
+    try:
+        lock_file = open(f"{REFERRAL_PATH}.lock", 'a')
+    except OSError:
+        # No ledger directory - nothing to protect, load_local_ledger reports the error
+        yield
+        return
+
+    with lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+# Read once per process; call get_user_id.cache_clear() after the identity changes
+@functools.lru_cache(maxsize=1)
 def get_user_id():
     """Get user's unique ID from system identity"""
     try:
-        with open(IDENTITY_PATH, 'r') as f:
-            identity = json.load(f)
-            return identity.get("user_id")
+        return _parse_json(IDENTITY_PATH).get("user_id")
+    except (OSError, ValueError):
+        return None
+
+
+_SESSION = None
+
+
+def _session():
+    """Shared JSONBin session so repeat calls reuse one keep-alive TLS connection"""
+    global _SESSION
+    if _SESSION is None:
+        # Imported here so actions that never touch the network skip loading requests
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        _SESSION = requests.Session()
+        _SESSION.headers.update({"X-Master-Key": JSONBIN_KEY})
+        retries = Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        _SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retries))
+    return _SESSION
+
+
+# Last JSONBin installs map fetched (or written) by this process, so an
+# unlock flow can PUT its update without fetching the same record again
+_JSONBIN_CACHE = {"installs": None, "fetched_at": 0.0}
+
+
+def _remember_installs(installs):
+    """Record installs as the latest known JSONBin state"""
+    _JSONBIN_CACHE.update(installs=installs, fetched_at=time.monotonic())
+
+
+def _recent_installs():
+    """The cached installs map if it's younger than JSONBIN_CACHE_TTL, else None"""
+    if time.monotonic() - _JSONBIN_CACHE["fetched_at"] > JSONBIN_CACHE_TTL:
+        return None
+    return _JSONBIN_CACHE["installs"]
+
+
+_INFLIGHT = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+
+def _fetch_jsonbin_installs():
+    """
+    GET the JSONBin record and return its installs map (None on a non-200 response)
+
+    Concurrent callers in this process share one in-flight GET: the first
+    performs it and the rest wait on its Future.
+    """
+    with _INFLIGHT_LOCK:
+        future = _INFLIGHT.get("get:latest")
+        owner = future is None
+        if owner:
+            future = _INFLIGHT["get:latest"] = Future()
+
+    if not owner:
+        return future.result()
+
+    try:
+        future.set_result(_get_jsonbin_installs())
     except Exception as e:
+        future.set_exception(e)
+    finally:
+        with _INFLIGHT_LOCK:
+            del _INFLIGHT["get:latest"]
+    return future.result()
+
+
+def _get_jsonbin_installs():
+    """Perform the JSONBin GET behind _fetch_jsonbin_installs"""
+    response = _session().get(
+        f"https://api.jsonbin.io/v3/b/{JSONBIN_ID}/latest",
+        timeout=JSONBIN_TIMEOUT
+    )
+
+    if response.status_code != 200:
         return None
 
+    full_ledger = _loads(response.content).get("record", {})
+    installs = full_ledger.get("installs", {})
+    _remember_installs(installs)
+    return installs
+
+
+_LAST_PULL = {"at": None}
+
+
+def sync_from_jsonbin(force=False):
+    """
+    Sync credits FROM JSONBin to local ledger
+
+    Skipped if this process pulled successfully within SYNC_TTL seconds,
+    unless force is set.
+    """
+    # A queued or running push means the local ledger is ahead of JSONBin - don't clobber it
+    if _PENDING_SYNC["worker"] is not None:
+        return {"status": "success"}
+
+    last_pull = _LAST_PULL["at"]
+    if not force and last_pull is not None and time.monotonic() - last_pull < SYNC_TTL:
+        return {"status": "success"}
 
-def sync_from_jsonbin():
-    """Sync credits FROM JSONBin to local ledger"""
     try:
         user_id = get_user_id()
         if not user_id:
             return {"error": "No user ID found"}
 
-        response = requests.get(
-            f"https://api.jsonbin.io/v3/b/{JSONBIN_ID}/latest",
-            headers={"X-Master-Key": JSONBIN_KEY}
-        )
-
-        if response.status_code != 200:
+        # Fetch outside the ledger lock so other processes' unlocks don't
+        # wait on the HTTP round-trip; the stamp tells us if they wrote meanwhile
+        stamp = _file_stamp(REFERRAL_PATH)
+        installs = _fetch_jsonbin_installs()
+        if installs is None:
             return {"error": "Failed to fetch JSONBin ledger"}
 
-        full_ledger = response.json().get("record", {})
-        installs = full_ledger.get("installs", {})
+        if user_id not in installs:
+            return {"error": f"User {user_id} not found in JSONBin"}
+
+        with _ledger_lock():
+            # A deduction committed during the fetch is newer than this
+            # snapshot - keep it rather than overwrite it with stale data
+            if _file_stamp(REFERRAL_PATH) != stamp:
+                return {"status": "success"}
 
-        if user_id in installs:
             # Update local ledger with JSONBin data
-            save_local_ledger(installs[user_id])
-            return {"status": "success"}
-        else:
-            return {"error": f"User {user_id} not found in JSONBin"}
+            save_result = save_local_ledger(installs[user_id])
+            if "error" in save_result:
+                return save_result
+
+        _LAST_PULL["at"] = time.monotonic()
+        return {"status": "success"}
 
     except Exception as e:
         return {"error": f"JSONBin sync error: {e}"}
 
 
-def sync_to_jsonbin(user_id, ledger):
-    """Sync local ledger to JSONBin cloud"""
-    try:
-        response = requests.get(
-            f"https://api.jsonbin.io/v3/b/{JSONBIN_ID}/latest",
-            headers={"X-Master-Key": JSONBIN_KEY}
-        )
-
-        if response.status_code != 200:
-            return {"error": "Failed to fetch JSONBin ledger"}
+def sync_to_jsonbin(user_id, ledger, installs=None):
+    """
+    Sync local ledger to JSONBin cloud
 
-        full_ledger = response.json().get("record", {})
-        installs = full_ledger.get("installs", {})
+    Pass the installs map from an earlier fetch in the same flow to skip
+    re-fetching the record before the PUT.
+    """
+    try:
+        if installs is None:
+            installs = _fetch_jsonbin_installs()
+            if installs is None:
+                return {"error": "Failed to fetch JSONBin ledger"}
 
+        installs = dict(installs)
         installs[user_id] = ledger
 
         updated = {
@@ -133,16 +361,15 @@ def sync_to_jsonbin(user_id, ledger):
             "installs": installs
         }
 
-        response = requests.put(
+        response = _session().put(
             f"https://api.jsonbin.io/v3/b/{JSONBIN_ID}",
-            headers={
-                "Content-Type": "application/json",
-                "X-Master-Key": JSONBIN_KEY
-            },
-            json=updated
+            data=_dumps(updated),
+            headers={"Content-Type": "application/json"},
+            timeout=JSONBIN_TIMEOUT
         )
 
         if response.status_code == 200:
+            _remember_installs(installs)
             return {"status": "success"}
         else:
             return {"error": f"JSONBin sync failed: {response.status_code}"}
@@ -151,17 +378,62 @@ def sync_to_jsonbin(user_id, ledger):
         return {"error": f"JSONBin sync error: {e}"}
 
 
+def _add_unlocked(ledger, *tool_names):
+    """Return the ledger's tools_unlocked list with tool_names appended, order kept and duplicates dropped"""
+    return list(dict.fromkeys([*ledger.get("tools_unlocked", []), *tool_names]))
+
+
+# Ledger waiting to be pushed to JSONBin, and the background worker pushing
+# it. Unlocks hand their ledger to the worker and return without waiting on
+# the network; a ledger queued while a push is running replaces any older
+# queued one, so the worker always sends the latest state.
+_PENDING_SYNC = {"user_id": None, "ledger": None, "worker": None}
+_SYNC_LOCK = threading.Lock()
+
+
+def _queue_jsonbin_sync(ledger):
+    """Hand a snapshot of ledger to the background JSONBin worker, starting it if needed"""
+    user_id = get_user_id()
+    if not user_id:
+        return
+
+    with _SYNC_LOCK:
+        _PENDING_SYNC.update(user_id=user_id, ledger=copy.deepcopy(ledger))
+        if _PENDING_SYNC["worker"] is None:
+            worker = threading.Thread(target=_jsonbin_sync_worker, daemon=True)
+            _PENDING_SYNC["worker"] = worker
+            worker.start()
+
+
+def _jsonbin_sync_worker():
+    """Push queued ledgers until none are left, warning (without failing) on errors"""
+    while True:
+        with _SYNC_LOCK:
+            user_id, ledger = _PENDING_SYNC["user_id"], _PENDING_SYNC["ledger"]
+            if ledger is None:
+                _PENDING_SYNC["worker"] = None
+                return
+            _PENDING_SYNC.update(user_id=None, ledger=None)
+
+        sync_result = sync_to_jsonbin(user_id, ledger, installs=_recent_installs())
+        if "error" in sync_result:
+            print(f"⚠️  Warning: JSONBin sync failed: {sync_result['error']}", file=sys.stderr)
+
+
+@atexit.register
+def _wait_jsonbin_sync():
+    """Don't let the CLI exit before the queued JSONBin push has finished"""
+    worker = _PENDING_SYNC["worker"]
+    if worker is not None:
+        worker.join()
+
+
 def register_tool_actions(tool_name):
     """Register tool actions in system_settings.ndjson"""
     try:
+        # add_tool reports a missing script itself ("Tool script not found: ...")
         tool_script = os.path.join(BASE_DIR, f"{tool_name}.py")
 
-        if not os.path.exists(tool_script):
-            return {"error": f"Tool script not found: {tool_script}"}
-
-        sys.path.insert(0, BASE_DIR)
-        from system_settings import add_tool
-
         # Tool is being unlocked, so register as unlocked with no cost
         result = add_tool({
             "tool_name": tool_name, 
@@ -178,7 +450,6 @@ def register_tool_actions(tool_name):
 def run_setup_script(script_path):
     """Execute the setup script via standalone helper"""
     try:
-        from setup_script_runner import run_setup_script as execute_setup
         return execute_setup(script_path)
     except Exception as e:
         return {
@@ -194,11 +465,17 @@ def find_tool_location(tool_name):
     - 'marketplace': exists in orchestrate_app_store.json
     - 'not_found': doesn't exist anywhere
     """
-    # Check registry for pre-installed tool
-    registry = load_registry()
-    for entry in registry:
-        if entry.get("tool") == tool_name and entry.get("action") == "__tool__":
-            return "preinstalled", entry.get("referral_unlock_cost", 0)
+    # Check registry for pre-installed tool - through the registry index when
+    # the registry is already parsed, otherwise stream it up to the first hit
+    if _is_cached(SYSTEM_REGISTRY):
+        header = _registry_index().get((tool_name, "__tool__"))
+    else:
+        header = next((
+            entry for entry in _scan_registry(_name_needles(tool_name), SYSTEM_REGISTRY)
+            if entry.get("tool") == tool_name and entry.get("action") == "__tool__"
+        ), None)
+    if header is not None:
+        return "preinstalled", header.get("referral_unlock_cost", 0)
 
     # Check app store for marketplace tool
     app_store = load_app_store()
@@ -208,139 +485,140 @@ def find_tool_location(tool_name):
     return "not_found", 0
 
 
-def unlock_preinstalled_tool(tool_name, cost):
-    """Unlock a pre-installed tool (mark as unlocked in registry)"""
-    # Load unlock messages
-    unlock_messages_path = os.path.join(RUNTIME_DIR, "data", "unlock_messages.json")
-    try:
-        with open(unlock_messages_path, "r") as f:
-            unlock_messages = json.load(f)
-    except FileNotFoundError:
-        unlock_messages = {}
+def _is_unlocked_locally(tool_name):
+    """True if the local ledger already lists tool_name as unlocked"""
+    ledger = _read_local_ledger()
+    return "error" not in ledger and tool_name in ledger.get("tools_unlocked", [])
+
+
+def _deduct_credits(tool_name, cost):
+    """
+    Charge cost for tool_name against the ledger - the part every unlock shares
+
+    Checks the local ledger, syncs from JSONBin, then re-checks, deducts and
+    saves under the ledger lock and queues the JSONBin push. Returns
+    (ledger, error): (ledger, None) once charged, (None, error_dict) on
+    failure, (None, None) if the tool was already unlocked.
+    """
+    # Already unlocked locally - answer without a JSONBin round-trip
+    if _is_unlocked_locally(tool_name):
+        return None, None
 
     # Sync from JSONBin first
     sync_from_jsonbin()
 
-    # Load ledger
-    ledger = load_local_ledger()
-    if "error" in ledger:
-        return ledger
-
-    # Check if already unlocked
-    unlocked_tools = ledger.get("tools_unlocked", [])
-    if tool_name in unlocked_tools:
-        # Special handling for claude_assistant - return auth instructions
-        if tool_name == "claude_assistant":
-            return {
-                "status": "already_unlocked",
-                "message": "✅ claude_assistant is already unlocked",
-                "auth_required": True,
-                "auth_instructions": "🔐 AUTHENTICATION REQUIRED:\n\nRun this command in the container to authenticate:\n\n/home/orchestrate/.local/bin/claude auth login\n\nThis will provide a URL to complete OAuth authentication.\nAfter authentication, Claude Code can execute autonomous tasks."
+    # Read-check-deduct-write under the ledger lock so concurrent unlocks
+    # can't both spend the same credits
+    with _ledger_lock():
+        # Load ledger
+        ledger = load_local_ledger()
+        if "error" in ledger:
+            return None, ledger
+
+        # Check if already unlocked
+        unlocked_tools = set(ledger.get("tools_unlocked", []))
+        if tool_name in unlocked_tools:
+            return None, None
+
+        # Check credits
+        current_credits = ledger.get("referral_credits", 0)
+        if current_credits < cost:
+            return None, {
+                "error": f"Insufficient credits. Need {cost}, have {current_credits}",
+                "credits_needed": cost - current_credits
             }
 
-        # Return message from unlock_messages.json if available
-        tool_message = unlock_messages.get(tool_name, {})
-        message = tool_message.get("message", f"✅ {tool_name} is already unlocked")
-        return {
-            "status": "already_unlocked",
-            "message": message
-        }
+        # Deduct credits
+        ledger["referral_credits"] -= cost
+        ledger["tools_unlocked"] = _add_unlocked(ledger, tool_name)
 
-    # Check credits
-    current_credits = ledger.get("referral_credits", 0)
-    if current_credits < cost:
-        return {
-            "error": f"Insufficient credits. Need {cost}, have {current_credits}",
-            "credits_needed": cost - current_credits
-        }
+        # Save local ledger
+        save_result = save_local_ledger(ledger)
+        if "error" in save_result:
+            return None, save_result
 
-    # Deduct credits
-    ledger["referral_credits"] -= cost
-    ledger["tools_unlocked"].append(tool_name)
+    # Sync to JSONBin in the background
+    _queue_jsonbin_sync(ledger)
+    return ledger, None
 
-    # Save local ledger
-    save_result = save_local_ledger(ledger)
-    if "error" in save_result:
-        return save_result
 
-    # Sync to JSONBin
-    user_id = get_user_id()
-    if user_id:
-        sync_result = sync_to_jsonbin(user_id, ledger)
-        if "error" in sync_result:
-            print(f"⚠️  Warning: JSONBin sync failed: {sync_result['error']}", file=sys.stderr)
+def _mark_unlocked_in_registry(tool_names):
+    """Flip the __tool__ headers of tool_names to unlocked, rewriting the registry once (and only if one changed)"""
+    index = _registry_index()
+    dirty = False
+    for tool_name in tool_names:
+        header = index.get((tool_name, "__tool__"))
+        if header is not None and (header.get("locked") is not False or not header.get("unlocked")):
+            header["locked"] = False
+            header["unlocked"] = True
+            dirty = True
+
+    if dirty:
+        save_registry(load_registry())
 
-    # Mark as unlocked in registry
-    registry = load_registry()
-    for entry in registry:
-        if entry.get("tool") == tool_name and entry.get("action") == "__tool__":
-            entry["locked"] = False
-            entry["unlocked"] = True
-            break
 
-    save_registry(registry)
+def _preinstalled_already_unlocked(tool_name):
+    """Response for unlocking a pre-installed tool the user already has"""
+    # Special handling for claude_assistant - return auth instructions
+    if tool_name == "claude_assistant":
+        return {
+            "status": "already_unlocked",
+            "message": "✅ claude_assistant is already unlocked",
+            "auth_required": True,
+            "auth_instructions": "🔐 AUTHENTICATION REQUIRED:\n\nRun this command in the container to authenticate:\n\n/home/orchestrate/.local/bin/claude auth login\n\nThis will provide a URL to complete OAuth authentication.\nAfter authentication, Claude Code can execute autonomous tasks."
+        }
 
+    # Return message from unlock_messages.json if available
+    tool_message = _load_unlock_messages().get(tool_name, {})
+    message = tool_message.get("message", f"✅ {tool_name} is already unlocked")
+    return {
+        "status": "already_unlocked",
+        "message": message
+    }
+
+
+def _preinstalled_unlocked(tool_name, credits_remaining):
+    """Response for a pre-installed tool that was just unlocked"""
     # Get unlock message from unlock_messages.json
-    tool_message = unlock_messages.get(tool_name, {})
+    tool_message = _load_unlock_messages().get(tool_name, {})
     if tool_message:
-        message = tool_message.get("message", f"✅ {tool_name} unlocked! {ledger['referral_credits']} credits remaining.")
+        message = tool_message.get("message", f"✅ {tool_name} unlocked! {credits_remaining} credits remaining.")
     else:
-        message = f"✅ {tool_name} unlocked! {ledger['referral_credits']} credits remaining."
+        message = f"✅ {tool_name} unlocked! {credits_remaining} credits remaining."
 
     return {
         "status": "success",
         "tool": tool_name,
         "type": "preinstalled",
-        "credits_remaining": ledger["referral_credits"],
+        "credits_remaining": credits_remaining,
         "message": message
     }
 
 
-def unlock_marketplace_tool(tool_name, cost):
-    """Unlock a marketplace tool (register + add to registry)"""
-    # Sync from JSONBin first
-    sync_from_jsonbin()
-
-    app_store = load_app_store()
-    tool_config = app_store.get(tool_name, {})
-
-    # Load ledger
-    ledger = load_local_ledger()
-    if "error" in ledger:
-        return ledger
+def unlock_preinstalled_tool(tool_name, cost):
+    """Unlock a pre-installed tool (mark as unlocked in registry)"""
+    ledger, error = _deduct_credits(tool_name, cost)
+    if error is not None:
+        return error
+    if ledger is None:
+        return _preinstalled_already_unlocked(tool_name)
 
-    # Check if already unlocked
-    unlocked_tools = ledger.get("tools_unlocked", [])
-    if tool_name in unlocked_tools:
-        return {
-            "status": "already_unlocked",
-            "message": f"✅ {tool_config.get('label', tool_name)} is already unlocked"
-        }
+    # Mark as unlocked in registry
+    _mark_unlocked_in_registry([tool_name])
 
-    # Check credits
-    current_credits = ledger.get("referral_credits", 0)
-    if current_credits < cost:
-        return {
-            "error": f"Insufficient credits. Need {cost}, have {current_credits}",
-            "credits_needed": cost - current_credits
-        }
+    return _preinstalled_unlocked(tool_name, ledger["referral_credits"])
 
-    # Deduct credits
-    ledger["referral_credits"] -= cost
-    ledger["tools_unlocked"].append(tool_name)
 
-    # Save local ledger
-    save_result = save_local_ledger(ledger)
-    if "error" in save_result:
-        return save_result
+def _marketplace_already_unlocked(tool_name, tool_config):
+    """Response for unlocking a marketplace tool the user already has"""
+    return {
+        "status": "already_unlocked",
+        "message": f"✅ {tool_config.get('label', tool_name)} is already unlocked"
+    }
 
-    # Sync to JSONBin
-    user_id = get_user_id()
-    if user_id:
-        sync_result = sync_to_jsonbin(user_id, ledger)
-        if "error" in sync_result:
-            print(f"⚠️  Warning: JSONBin sync failed: {sync_result['error']}", file=sys.stderr)
 
+def _marketplace_unlocked(tool_name, tool_config, credits_remaining):
+    """Register a marketplace tool that was just paid for and build its response"""
     # Register tool actions
     register_result = register_tool_actions(tool_name)
     if "error" in register_result:
@@ -358,8 +636,8 @@ def unlock_marketplace_tool(tool_name, cost):
             "tool": tool_name,
             "type": "marketplace",
             "label": tool_config.get("label", tool_name),
-            "credits_remaining": ledger["referral_credits"],
-            "unlock_message": f"✅ {tool_config.get('label', tool_name)} unlocked! ({ledger['referral_credits']} credits remaining)\n\n🔧 Authentication Required - Copy/paste this into Terminal:\n\nbash ~/Documents/Orchestrate/{setup_script}\n\nThis opens your browser for Claude Code OAuth (takes 30 seconds).",
+            "credits_remaining": credits_remaining,
+            "unlock_message": f"✅ {tool_config.get('label', tool_name)} unlocked! ({credits_remaining} credits remaining)\n\n🔧 Authentication Required - Copy/paste this into Terminal:\n\nbash ~/Documents/Orchestrate/{setup_script}\n\nThis opens your browser for Claude Code OAuth (takes 30 seconds).",
             "post_unlock_nudge": tool_config.get("post_unlock_nudge", "")
         }
 
@@ -369,7 +647,7 @@ def unlock_marketplace_tool(tool_name, cost):
         "tool": tool_name,
         "type": "marketplace",
         "label": tool_config.get("label", tool_name),
-        "credits_remaining": ledger["referral_credits"],
+        "credits_remaining": credits_remaining,
         "unlock_message": tool_config.get("unlock_message", f"✅ {tool_config.get('label', tool_name)} unlocked!")
     }
 
@@ -379,6 +657,26 @@ def unlock_marketplace_tool(tool_name, cost):
     return response
 
 
+def unlock_marketplace_tool(tool_name, cost=None):
+    """
+    Unlock a marketplace tool (register + add to registry)
+
+    cost defaults to the tool's referral_unlock_cost in the app store.
+    """
+    app_store = load_app_store()
+    tool_config = app_store.get(tool_name, {})
+    if cost is None:
+        cost = tool_config.get("referral_unlock_cost", 0)
+
+    ledger, error = _deduct_credits(tool_name, cost)
+    if error is not None:
+        return error
+    if ledger is None:
+        return _marketplace_already_unlocked(tool_name, tool_config)
+
+    return _marketplace_unlocked(tool_name, tool_config, ledger["referral_credits"])
+
+
 def unlock_tool(tool_name):
     """
     Unified unlock function - intelligently routes to correct unlock flow
@@ -406,10 +704,101 @@ def unlock_tool(tool_name):
         return unlock_marketplace_tool(tool_name, cost)
 
 
+def unlock_tools(tool_names):
+    """
+    Unlock several tools with one ledger update and one JSONBin sync
+
+    Nothing is charged if any tool is unknown or the combined cost exceeds
+    the available credits. Tools that are already unlocked are skipped.
+    Each result is the response the single unlock would give for that tool.
+    """
+    if not isinstance(tool_names, list) or not all(isinstance(name, str) for name in tool_names):
+        return {"error": "tool_names must be a list of tool names"}
+    if not tool_names:
+        return {"error": "No tools given"}
+
+    tool_names = list(dict.fromkeys(tool_names))
+
+    # Parse the registry once so every lookup below goes through the index
+    load_registry()
+    locations = {}
+    for tool_name in tool_names:
+        location, cost = find_tool_location(tool_name)
+        if location == "not_found":
+            return {
+                "error": f"Tool '{tool_name}' not found in pre-installed tools or marketplace"
+            }
+        locations[tool_name] = (location, cost)
+
+    # Only pull from JSONBin when the local ledger says something will be charged
+    local_ledger = _read_local_ledger()
+    if "error" in local_ledger or any(
+        cost > 0 for name, (_, cost) in locations.items()
+        if name not in local_ledger.get("tools_unlocked", [])
+    ):
+        sync_from_jsonbin()
+
+    # Same locked read-check-deduct-write as a single unlock, for all tools at once
+    with _ledger_lock():
+        ledger = load_local_ledger()
+        if "error" in ledger:
+            return ledger
+
+        unlocked_tools = set(ledger.get("tools_unlocked", []))
+        to_unlock = [name for name in tool_names if name not in unlocked_tools]
+        total_cost = sum(locations[name][1] for name in to_unlock)
+
+        current_credits = ledger.get("referral_credits", 0)
+        if current_credits < total_cost:
+            return {
+                "error": f"Insufficient credits. Need {total_cost}, have {current_credits}",
+                "credits_needed": total_cost - current_credits
+            }
+
+        if to_unlock:
+            ledger["referral_credits"] = current_credits - total_cost
+            ledger["tools_unlocked"] = _add_unlocked(ledger, *to_unlock)
+
+            save_result = save_local_ledger(ledger)
+            if "error" in save_result:
+                return save_result
+
+    if to_unlock:
+        _queue_jsonbin_sync(ledger)
+
+    # Flip pre-installed headers first: registering marketplace tools
+    # rewrites the registry through system_settings
+    _mark_unlocked_in_registry([name for name in to_unlock if locations[name][0] == "preinstalled"])
+
+    app_store = load_app_store()
+    credits_remaining = ledger.get("referral_credits", 0)
+    results = []
+    for tool_name in tool_names:
+        already_unlocked = tool_name not in to_unlock
+        if locations[tool_name][0] == "preinstalled":
+            if already_unlocked:
+                result = _preinstalled_already_unlocked(tool_name)
+            else:
+                result = _preinstalled_unlocked(tool_name, credits_remaining)
+        else:
+            tool_config = app_store.get(tool_name, {})
+            if already_unlocked:
+                result = _marketplace_already_unlocked(tool_name, tool_config)
+            else:
+                result = _marketplace_unlocked(tool_name, tool_config, credits_remaining)
+        results.append({"tool": tool_name, **result})
+
+    return {
+        "status": "success",
+        "credits_remaining": credits_remaining,
+        "results": results
+    }
+
+
 def list_marketplace_tools():
     """List all available marketplace tools with lock status"""
     app_store = load_app_store()
-    ledger = load_local_ledger()
+    ledger = _read_local_ledger()
 
     if "error" in ledger:
         return ledger
@@ -417,9 +806,8 @@ def list_marketplace_tools():
     unlocked = set(ledger.get("tools_unlocked", []))
     credits = ledger.get("referral_credits", 0)
 
-    tools = []
-    for tool_name, config in app_store.items():
-        tools.append({
+    tools = [
+        {
             "name": tool_name,
             "label": config.get("label", tool_name),
             "description": config.get("description", ""),
@@ -429,9 +817,9 @@ def list_marketplace_tools():
             "requires_subscription": config.get("requires_subscription", False),
             "subscription_type": config.get("subscription_type", None),
             "requires_credentials": config.get("requires_credentials", False)
-        })
-
-    tools.sort(key=lambda x: x["priority"])
+        }
+        for tool_name, config in _app_store_by_priority(app_store)
+    ]
 
     return {
         "status": "success",
@@ -440,9 +828,12 @@ def list_marketplace_tools():
     }
 
 
-def get_credits_balance():
-    """Get current credit balance"""
-    ledger = load_local_ledger()
+def get_credits_balance(refresh=False):
+    """Get current credit balance (pass refresh=True to pull from JSONBin first)"""
+    if refresh:
+        sync_from_jsonbin(force=True)
+
+    ledger = _read_local_ledger()
     if "error" in ledger:
         return ledger
 
@@ -454,6 +845,37 @@ def get_credits_balance():
     }
 
 
+ACTIONS = {
+    "find_tool_location": find_tool_location,
+    "get_credits_balance": get_credits_balance,
+    "get_user_id": get_user_id,
+    "list_marketplace_tools": list_marketplace_tools,
+    "load_app_store": load_app_store,
+    "load_local_ledger": load_local_ledger,
+    "load_registry": load_registry,
+    "register_tool_actions": register_tool_actions,
+    "run_setup_script": run_setup_script,
+    "save_local_ledger": save_local_ledger,
+    "save_registry": save_registry,
+    "sync_from_jsonbin": sync_from_jsonbin,
+    "sync_to_jsonbin": sync_to_jsonbin,
+    "unlock_marketplace_tool": unlock_marketplace_tool,
+    "unlock_preinstalled_tool": unlock_preinstalled_tool,
+    "unlock_tool": unlock_tool,
+    "unlock_tools": unlock_tools
+}
+
+# Actions that are called without params; everything else takes them as keyword arguments
+NO_PARAM_ACTIONS = {
+    "get_user_id",
+    "list_marketplace_tools",
+    "load_app_store",
+    "load_local_ledger",
+    "load_registry",
+    "sync_from_jsonbin"
+}
+
+
 def main():
     import argparse
     import json
@@ -464,40 +886,13 @@ def main():
     args = parser.parse_args()
     params = json.loads(args.params) if args.params else {}
 
-    if args.action == 'find_tool_location':
-        result = find_tool_location(**params)
-    elif args.action == 'get_credits_balance':
-        result = get_credits_balance()
-    elif args.action == 'get_user_id':
-        result = get_user_id()
-    elif args.action == 'list_marketplace_tools':
-        result = list_marketplace_tools()
-    elif args.action == 'load_app_store':
-        result = load_app_store()
-    elif args.action == 'load_local_ledger':
-        result = load_local_ledger()
-    elif args.action == 'load_registry':
-        result = load_registry()
-    elif args.action == 'register_tool_actions':
-        result = register_tool_actions(**params)
-    elif args.action == 'run_setup_script':
-        result = run_setup_script(**params)
-    elif args.action == 'save_local_ledger':
-        result = save_local_ledger(**params)
-    elif args.action == 'save_registry':
-        result = save_registry(**params)
-    elif args.action == 'sync_from_jsonbin':
-        result = sync_from_jsonbin()
-    elif args.action == 'sync_to_jsonbin':
-        result = sync_to_jsonbin(**params)
-    elif args.action == 'unlock_marketplace_tool':
-        result = unlock_marketplace_tool(**params)
-    elif args.action == 'unlock_preinstalled_tool':
-        result = unlock_preinstalled_tool(**params)
-    elif args.action == 'unlock_tool':
-        result = unlock_tool(**params)
-    else:
+    fn = ACTIONS.get(args.action)
+    if fn is None:
         result = {'status': 'error', 'message': f'Unknown action {args.action}'}
+    elif args.action in NO_PARAM_ACTIONS:
+        result = fn()
+    else:
+        result = fn(**params)
 
     print(json.dumps(result, indent=2))
 